@@ -2,34 +2,28 @@ import datetime
 import json
 import os
 import asyncio
+import time
 from chinese_calendar import is_holiday, is_workday
 import chinese_calendar as calendar
-from cn_bing_translator import Translator
 from astrbot.api import logger
 
+try:
+    import orjson
+except ImportError:  # orjson 为可选依赖，未安装时回退到标准库 json
+    orjson = None
+
+try:
+    from .utils.holiday_names import HOLIDAY_ZH
+except ImportError:  # 作为脚本直接运行时没有父包，改用绝对导入
+    from utils.holiday_names import HOLIDAY_ZH
+
 # JSON 文件路径，将在调用时动态设置
 JSON_FILE = None
 
-async def translate_holiday_name(holiday_name: str) -> str:
-    """
-    使用必应翻译将英文的节假日名称翻译成中文。
-
-    Args:
-        holiday_name (str): 英文节假日名称 (例如, 'New Year''s Day')。
-
-    Returns:
-        str: 翻译后的中文名称，如果翻译失败则返回原名称。
-    """
-    if not holiday_name:
-        return ''
-    try:
-        translator = Translator(toLang='zh-Hans')
-        # 在单独的线程中运行同步IO操作
-        result = await asyncio.to_thread(translator.process, holiday_name)
-        return result if result and result != holiday_name else holiday_name
-    except Exception as e:
-        logger.warning(f"警告: 翻译节日名称 '{holiday_name}' 失败: {e}")
-        return holiday_name
+# get_current_year_holidays 的结果缓存，键为 (年份, 文件路径)，值为 (写入时间, 节假日列表)
+_HOLIDAYS_CACHE = {}
+# 结果缓存的有效期（秒）
+HOLIDAYS_CACHE_TTL = 3600
 
 def load_holidays_from_json(json_file: str) -> tuple[int | None, list]:
     """
@@ -43,15 +37,21 @@ def load_holidays_from_json(json_file: str) -> tuple[int | None, list]:
     """
     if json_file is None:
         json_file = 'holidays.json'  # 默认文件名
-    if os.path.exists(json_file):
-        try:
-            with open(json_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                return data.get('year'), data.get('holidays', [])
-        except (json.JSONDecodeError, IOError) as e:
-            logger.error(f"错误: 加载节假日数据失败: {e}")
-            return None, []
-    return None, []
+    try:
+        # 一次性读取整个文件后再解析
+        with open(json_file, 'rb') as f:
+            raw = f.read()
+    except FileNotFoundError:
+        return None, []
+    except IOError as e:
+        logger.error(f"错误: 加载节假日数据失败: {e}")
+        return None, []
+    try:
+        data = orjson.loads(raw) if orjson else json.loads(raw)
+        return data.get('year'), data.get('holidays', [])
+    except ValueError as e:
+        logger.error(f"错误: 加载节假日数据失败: {e}")
+        return None, []
 
 def save_holidays_to_json(year: int, holidays: list, json_file: str):
     """
@@ -69,8 +69,12 @@ def save_holidays_to_json(year: int, holidays: list, json_file: str):
         'holidays': holidays
     }
     try:
-        with open(json_file, 'w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+        if orjson:
+            with open(json_file, 'wb') as f:
+                f.write(orjson.dumps(data))
+        else:
+            with open(json_file, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False, separators=(',', ':'))
         logger.info(f"节假日数据已成功保存到 {json_file}")
     except IOError as e:
         logger.error(f"错误: 保存节假日数据失败: {e}")
@@ -79,7 +83,7 @@ async def get_year_holidays(year: int, json_file: str = None) -> list:
     """
     获取指定年份全年的节假日详细信息。
 
-    遍历该年的每一天，使用 `chinese_calendar` 判断其状态，并进行翻译和格式化。
+    遍历该年的每一天，使用 `chinese_calendar` 判断其状态，并将节日名称转换为中文。
     新增了 `is_first_day` 字段，用于标记一个连续假期的第一天。
 
     Args:
@@ -92,16 +96,40 @@ async def get_year_holidays(year: int, json_file: str = None) -> list:
     start_date = datetime.date(year, 1, 1)
     end_date = datetime.date(year, 12, 31)
     holidays = []
-    current_date = start_date
     prev_holiday_name = None
 
+    # 优先直接查询 chinese_calendar 的底层字典，避免每天调用四个库函数；
+    # 若库的内部结构发生变化，则回退到逐日调用公开接口
+    try:
+        holidays_map = calendar.constants.holidays
+        workdays_map = calendar.constants.workdays
+        in_lieu_map = calendar.constants.in_lieu_days
+    except AttributeError:
+        holidays_map = workdays_map = in_lieu_map = None
+
     logger.info(f"\n正在获取 {year} 年的节假日信息...")
-    while current_date <= end_date:
+    if holidays_map is not None:
         try:
-            on_holiday, holiday_name = calendar.get_holiday_detail(current_date)
-            is_hol = is_holiday(current_date)
-            is_work = is_workday(current_date)
-            is_lieu = calendar.is_in_lieu(current_date)
+            # 校验年份是否受支持（不支持时抛出 NotImplementedError）
+            calendar.get_holiday_detail(end_date)
+        except Exception as e:
+            logger.warning(f"警告: 无法获取 {year} 年的节假日信息: {e}")
+            return holidays
+
+    for ordinal in range(start_date.toordinal(), end_date.toordinal() + 1):
+        current_date = datetime.date.fromordinal(ordinal)
+        try:
+            if holidays_map is not None:
+                holiday_name = holidays_map.get(current_date)
+                on_holiday = holiday_name is not None
+                is_work = current_date in workdays_map or (current_date.weekday() <= 4 and not on_holiday)
+                is_hol = not is_work
+                is_lieu = current_date in in_lieu_map
+            else:
+                on_holiday, holiday_name = calendar.get_holiday_detail(current_date)
+                is_hol = is_holiday(current_date)
+                is_work = is_workday(current_date)
+                is_lieu = calendar.is_in_lieu(current_date)
             
             holiday_info = {
                 'date': current_date.isoformat(),
@@ -113,7 +141,7 @@ async def get_year_holidays(year: int, json_file: str = None) -> list:
             }
             
             if on_holiday and holiday_name:
-                translated_name = await translate_holiday_name(holiday_name)
+                translated_name = HOLIDAY_ZH.get(holiday_name, holiday_name)
                 holiday_info['holiday_name'] = translated_name
                 
                 # 检测是否为连续假期的第一天
@@ -124,14 +152,12 @@ async def get_year_holidays(year: int, json_file: str = None) -> list:
                 if translated_name != prev_holiday_name:
                     logger.info(f"{current_date}: 是节假日 - {translated_name}")
                     if is_lieu:
-                        logger.info(f"  -> (调休)")
+                        logger.debug("  -> (调休)")
                     prev_holiday_name = translated_name
             
             holidays.append(holiday_info)
         except Exception as e:
             logger.warning(f"警告: 处理日期 {current_date} 时出错: {e}")
-        
-        current_date += datetime.timedelta(days=1)
     
     return holidays
 
@@ -139,7 +165,7 @@ async def get_current_year_holidays(json_file: str = None) -> list:
     """
     获取当前年份的节假日数据，优先从缓存加载。
 
-    如果缓存文件存在且年份匹配，则直接返回数据。
+    一小时内的重复调用直接返回内存中的结果；如果缓存文件存在且年份匹配，则直接返回数据。
     否则，调用 `get_year_holidays` 重新获取并保存到缓存。
 
     Args:
@@ -149,15 +175,24 @@ async def get_current_year_holidays(json_file: str = None) -> list:
         list: 当前年份的节假日数据列表。
     """
     current_year = datetime.date.today().year
-    saved_year, saved_holidays = load_holidays_from_json(json_file)
+    cache_key = (current_year, json_file)
+    cached = _HOLIDAYS_CACHE.get(cache_key)
+    if cached and time.monotonic() - cached[0] < HOLIDAYS_CACHE_TTL:
+        return cached[1]
+
+    # 文件读写放到线程中执行，避免阻塞事件循环
+    saved_year, saved_holidays = await asyncio.to_thread(load_holidays_from_json, json_file)
 
     if saved_year == current_year and saved_holidays:
         logger.info(f"已从缓存加载 {current_year} 年节假日数据，共 {len(saved_holidays)} 条记录。")
+        _HOLIDAYS_CACHE[cache_key] = (time.monotonic(), saved_holidays)
         return saved_holidays
     else:
         logger.info(f"未找到 {current_year} 年的缓存数据或数据已过时，正在重新获取...")
         holidays = await get_year_holidays(current_year, json_file)
-        save_holidays_to_json(current_year, holidays, json_file)
+        await asyncio.to_thread(save_holidays_to_json, current_year, holidays, json_file)
+        _HOLIDAYS_CACHE.clear()
+        _HOLIDAYS_CACHE[cache_key] = (time.monotonic(), holidays)
         return holidays
 
 def print_holidays_summary(holidays: list, year: int):
@@ -170,10 +205,13 @@ def print_holidays_summary(holidays: list, year: int):
     """
     logger.info(f"\n--- {year} 年节假日摘要 ---")
     total_days = len(holidays)
-    holiday_count = sum(1 for h in holidays if h['is_holiday'])
-    workday_count = sum(1 for h in holidays if h['is_workday'])
-    lieu_count = sum(1 for h in holidays if h['is_in_lieu'])
-    first_day_count = sum(1 for h in holidays if h['is_first_day'])
+    # 单次遍历同时统计各项（布尔值可直接相加）
+    holiday_count = workday_count = lieu_count = first_day_count = 0
+    for h in holidays:
+        holiday_count += h['is_holiday']
+        workday_count += h['is_workday']
+        lieu_count += h['is_in_lieu']
+        first_day_count += h['is_first_day']
     logger.info(f"总天数: {total_days}")
     logger.info(f"总节假日天数: {holiday_count}")
     logger.info(f"总工作日天数: {workday_count}")
@@ -191,19 +229,20 @@ async def check_single_date(date_input: datetime.date, json_file: str = None):
     """
     # 此函数主要用于演示，直接加载数据
     holidays = await get_current_year_holidays(json_file)
-    
-    for h in holidays:
-        if h['date'] == date_input.isoformat():
-            if h['is_holiday']:
-                logger.info(f"\n查询结果: {date_input} 是假期 - {h['holiday_name']}")
-            else:
-                logger.info(f"\n查询结果: {date_input} 是工作日")
-            
-            if h['is_in_lieu']:
-                logger.info(f"  -> (调休)")
-            return
-            
-    logger.info(f"\n查询结果: 在 {date_input.year} 年的记录中未找到 {date_input}。")
+    date_key = date_input.isoformat()
+    h = next((h for h in holidays if h['date'] == date_key), None)
+
+    if h is None:
+        logger.info(f"\n查询结果: 在 {date_input.year} 年的记录中未找到 {date_input}。")
+        return
+
+    if h['is_holiday']:
+        logger.info(f"\n查询结果: {date_input} 是假期 - {h['holiday_name']}")
+    else:
+        logger.info(f"\n查询结果: {date_input} 是工作日")
+
+    if h['is_in_lieu']:
+        logger.info(f"  -> (调休)")
 
 async def main():
     """异步主函数，用于执行脚本逻辑。"""
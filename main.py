@@ -8,13 +8,73 @@ import asyncio
 import aiofiles
 import json
 import os
+import sys
+import stat
 import base64
+from collections import OrderedDict
 from datetime import datetime, date, timedelta
-from chinese_calendar import is_holiday, is_workday
 import chinese_calendar as ch_calendar
 from pathlib import Path
-from .utils.ttp import generate_image_openrouter
-from .utils.file_send_server import send_file
+
+from .utils.holiday_names import HOLIDAY_ZH
+
+try:
+    import orjson
+except ImportError:  # orjson 为可选依赖，未安装时回退到标准库 json
+    orjson = None
+
+
+# LLM祝福语缓存的最大条目数
+BLESSING_CACHE_SIZE = 256
+
+# 生成图片缓存的最大条目数
+IMAGE_CACHE_SIZE = 32
+
+# 节日别名到规范名称的映射，使同一节日的不同叫法共用一份祝福语缓存
+HOLIDAY_ALIASES = {
+    "新年": "元旦",
+    "新春": "春节",
+    "过年": "春节",
+    "农历新年": "春节",
+    "清明": "清明节",
+    "五一": "劳动节",
+    "五一劳动节": "劳动节",
+    "端午": "端午节",
+    "中秋": "中秋节",
+    "国庆": "国庆节",
+    "十一": "国庆节",
+    "元宵": "元宵节",
+}
+
+# LLM不可用时使用的预设祝福语模板
+BLESSING_TEMPLATES = {
+    "春节": "新春快乐！祝您在新的一年里龙马精神，万事如意，阖家幸福！",
+    "元旦": "元旦快乐！新年新气象，愿您在新的一年里梦想成真，步步高升！",
+    "中秋节": "中秋节快乐！月圆人团圆，祝您和家人幸福美满，共享天伦之乐！",
+    "国庆节": "国庆节快乐！祝愿我们伟大的祖国繁荣昌盛，祝您节日愉快，笑口常开！",
+    "劳动节": "劳动节快乐！向所有辛勤的劳动者致敬，祝您度过一个轻松愉快的假期！",
+    "端午节": "端午安康！愿粽叶的清香带给您好运，祝您身体健康，平安吉祥！",
+    "清明节": "清明时节，缅怀先人，珍惜当下。愿逝者安息，生者奋发。",
+    "元宵节": "元宵节快乐！愿您人圆事圆花好月圆，甜甜蜜蜜，幸福团圆！"
+}
+
+# 插件目录，相对路径的参考图以此为基准
+PLUGIN_DIR = os.path.dirname(__file__)
+
+# 每年12月从该日起在后台预生成下一年的节假日数据
+PRELOAD_START_DAY = 15
+
+# 参考图扩展名到MIME类型的映射
+MIME_BY_EXT = {'.png': 'image/png', '.jpg': 'image/jpeg', '.jpeg': 'image/jpeg', '.gif': 'image/gif', '.webp': 'image/webp'}
+
+# 同时进行的图像生成请求数上限
+MAX_CONCURRENT_IMAGE_REQUESTS = 3
+
+# 广播消息时同时进行的发送数上限
+MAX_CONCURRENT_SENDS = 3
+
+# 单次图像请求中参考图 (base64) 的总大小上限
+REFERENCE_IMAGES_MAX_TOTAL_SIZE = 10 * 1024 * 1024
 
 
 @register("SendBlessings", "Cheng-MaoMao", "在节假日自动送上祝福并配图", "1.1.1")
@@ -24,6 +84,13 @@ class SendBlessingsPlugin(Star):
   
     继承自 `astrbot.api.star.Star`。
     """
+
+    # 静态提示词只构建一次，并保持逐字节一致，便于服务端的前缀缓存命中
+    _BLESSING_SYSTEM_PROMPT = "你是一个专业的节日祝福生成器，你的回答应该只包含祝福语文本本身，不要添加任何额外的解释或引言。"
+    _END_OF_HOLIDAY_SYSTEM_PROMPT = "你是一个善于鼓励和给予温暖祝福的AI助手。你的回答应该只包含祝福语文本本身，不要添加任何额外的解释或引言。"
+    _TRANSLATION_SYSTEM_PROMPT = "你是一个专业的翻译引擎，专门将节假日名称从英文翻译成中文，并以JSON格式返回结果。"
+    _IMAGE_NEGATIVE_PROMPT = "IMPORTANT: Do NOT generate any text, words, letters, characters, flags, national emblems, or religious symbols. The image must be purely visual and contain no writing."
+
     def __init__(self, context: Context, config):
         """
         插件初始化。
@@ -42,6 +109,8 @@ class SendBlessingsPlugin(Star):
         self.plugin_data_dir.mkdir(parents=True, exist_ok=True)
         
         self.json_file = self.plugin_data_dir / self.config.get('holidays_file', 'holidays.json')
+        self.translations_file = self.plugin_data_dir / 'holiday_translations.json'
+        self.blessing_cache_file = self.plugin_data_dir / 'blessing_cache.json'
         
         # 加载图像生成 (OpenRouter) 相关配置
         self.openrouter_api_keys = config.get("openrouter_api_keys", [])
@@ -52,22 +121,48 @@ class SendBlessingsPlugin(Star):
         # 加载文件传输服务器 (NAP) 相关配置
         self.nap_server_address = config.get("nap_server_address", "localhost")
         self.nap_server_port = config.get("nap_server_port", 3658)
+        self._use_nap = bool(self.nap_server_address) and self.nap_server_address != "localhost"
         
         # 加载参考图相关配置
         self.reference_images_config = config.get("reference_images", {})
         self.test_targets = config.get("test_targets", {})
+        self._test_targets = self._normalize_test_targets(self.test_targets)
         self.reference_images_enabled = self.reference_images_config.get("enabled", False)
         self.reference_image_paths = self.reference_images_config.get("image_paths", [])
         self.max_reference_images = self.reference_images_config.get("max_images", 3)
+        self._reference_images_cache = None
+        self._reference_images_mtimes = None
         
         self.holidays = []
+        self._holidays_by_date: dict[str, dict] = {}
+        self._holidays_year: int | None = None
+        self._first_day_dates: frozenset[str] = frozenset()
         self.logger = logger
 
+        # 当天日期及其ISO字符串，跨天时才重新格式化
+        self._today_iso_day: date | None = None
+        self._today_iso: str | None = None
+
+        # LLM祝福语缓存，键为 (节日名称, 日期)，同一天重复触发时不再调用LLM，重启后从磁盘恢复
+        self._blessing_cache: OrderedDict[tuple[str, str], str] = self._load_blessing_cache()
+
+        # 生成图片缓存，键为 (节日名称, 日期)，值为 (图片URL, 图片路径, 本地路径)；仅保存在内存中，重启后失效
+        self._image_cache: OrderedDict[tuple[str, str], tuple[str, str, str]] = OrderedDict()
+
+        self._preload_task = None
+        self._image_semaphore = asyncio.Semaphore(MAX_CONCURRENT_IMAGE_REQUESTS)
+
+        # 节假日缓存文件的内存副本，文件 mtime 未变化时跳过重复解析
+        self._holidays_file_cache = {'path': None, 'mtime': None, 'year': None, 'data': None}
+
         # 加载假期结束提醒配置
         self.end_of_holiday_config = config.get("end_of_holiday_blessing", {})
         
+        # 后台任务句柄，插件终止时统一取消
+        self._background_tasks: list[asyncio.Task] = []
+
         # 在后台启动异步初始化任务
-        asyncio.create_task(self.initialize())
+        self._background_tasks.append(asyncio.create_task(self.initialize()))
 
     async def initialize(self):
         """
@@ -79,15 +174,15 @@ class SendBlessingsPlugin(Star):
                 return
             
             # 加载或获取当前年份的节假日数据
-            self.holidays = await self._get_current_year_holidays(self.json_file)
+            self._set_holidays(await self._get_current_year_holidays(self.json_file))
             self._print_holidays_summary(self.holidays, datetime.now().year)
             
             # 启动每日祝福检查的后台循环任务
-            asyncio.create_task(self.daily_blessing_checker())
+            self._background_tasks.append(asyncio.create_task(self.daily_blessing_checker()))
             
             # 启动假期结束提醒的后台任务
             if self.end_of_holiday_config.get("enabled", False):
-                asyncio.create_task(self.end_of_holiday_checker())
+                self._background_tasks.append(asyncio.create_task(self.end_of_holiday_checker()))
 
             self.logger.info("节假日祝福插件初始化完成。")
         except Exception as e:
@@ -105,7 +200,7 @@ class SendBlessingsPlugin(Star):
         [管理员指令] 重新加载节假日数据。
         """
         try:
-            self.holidays = await self._get_current_year_holidays(self.json_file)
+            self._set_holidays(await self._get_current_year_holidays(self.json_file))
             yield event.plain_result(f"节假日数据已重新加载，共 {len(self.holidays)} 条记录。")
         except Exception as e:
             self.logger.error(f"重新加载节假日数据失败: {e}")
@@ -118,8 +213,7 @@ class SendBlessingsPlugin(Star):
         [管理员指令] 检查今天的日期状态。
         """
         try:
-            today = datetime.now().date()
-            today_info = next((h for h in self.holidays if h['date'] == today.isoformat()), None)
+            today_info = self._holidays_by_date.get(self._today_key())
             
             if today_info:
                 if today_info['is_first_day'] and today_info['is_holiday']:
@@ -143,15 +237,14 @@ class SendBlessingsPlugin(Star):
         该指令不再受节假日限制，可随时用于测试。
         """
         try:
-            # 1. 生成祝福语
-            blessing = await self.generate_blessing(holiday_name)
+            # 1. 并发生成祝福语和图片
+            blessing, image_path = await self._generate_blessing_with_image(self.generate_blessing(holiday_name), holiday_name)
             if not blessing:
                 yield event.plain_result("祝福语生成失败。")
                 return
             
-            # 2. 根据配置决定是否生成图片
+            # 2. 根据配置决定是否发送图片
             if self.config.get('generate_images_enabled', True):
-                image_url, image_path = await self.generate_image(blessing, holiday_name)
                 if image_path:
                     yield event.chain_result([Comp.Plain(blessing), Comp.Image.fromFileSystem(image_path)])
                 else:
@@ -175,17 +268,15 @@ class SendBlessingsPlugin(Star):
             holiday_name (str, optional): 要测试的节日名称。默认为 "手动测试"。
         """
         try:
-            group_ids = self.test_targets.get("group_ids", [])
-            user_ids = self.test_targets.get("user_ids", [])
-
-            if not group_ids and not user_ids:
+            if not self._test_targets:
                 yield event.plain_result("测试目标未配置。请在插件配置中设置 'test_targets'。")
                 return
 
-            yield event.plain_result(f"开始向 {len(group_ids)} 个群组和 {len(user_ids)} 个用户发送测试祝福...")
+            group_count = sum(1 for message_type, _ in self._test_targets if message_type == MessageType.GROUP_MESSAGE)
+            yield event.plain_result(f"开始向 {group_count} 个群组和 {len(self._test_targets) - group_count} 个用户发送测试祝福...")
 
-            # 1. 生成祝福语和图片
-            blessing = await self.generate_blessing(holiday_name)
+            # 1. 并发生成祝福语和图片
+            blessing, image_path = await self._generate_blessing_with_image(self.generate_blessing(holiday_name), holiday_name)
             if not blessing:
                 yield event.plain_result("祝福语生成失败，测试中止。")
                 return
@@ -193,51 +284,24 @@ class SendBlessingsPlugin(Star):
             # 2. 根据配置构建消息链
             chain = [Comp.Plain(blessing)]
             if self.config.get('generate_images_enabled', True):
-                image_url, image_path = await self.generate_image(blessing, holiday_name)
                 if image_path:
                     chain.append(Comp.Image.fromFileSystem(image_path))
                 else:
                     chain.append(Comp.Plain("\n(图片生成失败)"))
 
             # 3. 发送消息
-            success_count = 0
-            fail_count = 0
-
-            # 发送到群组
-            for group_id in group_ids:
-                sent_on_any_platform = False
-                for platform in self.context.platform_manager.get_insts():
-                    session_str = f"{platform.meta.name}:{MessageType.GROUP_MESSAGE.value}:{group_id}"
-                    try:
-                        if await self.context.send_message(session_str, chain):
-                            success_count += 1
-                            self.logger.info(f"测试祝福已发送到群组 {group_id} (平台: {platform.meta.name})")
-                            await asyncio.sleep(2)
-                            sent_on_any_platform = True
-                            break
-                    except Exception as e:
-                        self.logger.warning(f"尝试通过平台 {platform.meta.name} 发送测试祝福到群组 {group_id} 失败: {e}")
-                if not sent_on_any_platform:
-                    fail_count += 1
-                    self.logger.error(f"发送测试祝福到群组 {group_id} 失败: 所有平台都无法发送。")
-
-            # 发送到用户
-            for user_id in user_ids:
-                sent_on_any_platform = False
-                for platform in self.context.platform_manager.get_insts():
-                    session_str = f"{platform.meta.name}:{MessageType.FRIEND_MESSAGE.value}:{user_id}"
-                    try:
-                        if await self.context.send_message(session_str, chain):
-                            success_count += 1
-                            self.logger.info(f"测试祝福已发送到用户 {user_id} (平台: {platform.meta.name})")
-                            await asyncio.sleep(2)
-                            sent_on_any_platform = True
-                            break
-                    except Exception as e:
-                        self.logger.warning(f"尝试通过平台 {platform.meta.name} 发送测试祝福到用户 {user_id} 失败: {e}")
-                if not sent_on_any_platform:
-                    fail_count += 1
-                    self.logger.error(f"发送测试祝福到用户 {user_id} 失败: 所有平台都无法发送。")
+            # 测试目标数量有限，各目标并发发送，单个目标失败不影响其他目标
+            platform_names = [platform.meta.name for platform in self.context.platform_manager.get_insts()]
+            results = await asyncio.gather(
+                *(self._send_test_message(platform_names, message_type, target_id, chain)
+                  for message_type, target_id in self._test_targets),
+                return_exceptions=True
+            )
+            for (message_type, target_id), result in zip(self._test_targets, results):
+                if isinstance(result, Exception):
+                    self.logger.error(f"发送测试祝福到 {target_id} 时发生异常: {result}")
+            success_count = sum(1 for result in results if result is True)
+            fail_count = len(results) - success_count
 
             # 4. 报告结果
             yield event.plain_result(f"测试完成！\n成功发送: {success_count} 个\n失败: {fail_count} 个")
@@ -246,6 +310,31 @@ class SendBlessingsPlugin(Star):
             self.logger.error(f"测试祝福指令失败: {e}")
             yield event.plain_result(f"测试指令执行失败: {str(e)}")
 
+    @staticmethod
+    def _normalize_test_targets(test_targets: dict) -> list[tuple[MessageType, str]]:
+        """
+        将配置中的测试目标规整为 (消息类型, 目标ID) 列表，仅在初始化时执行一次。
+        """
+        targets = [(MessageType.GROUP_MESSAGE, str(group_id)) for group_id in test_targets.get("group_ids", []) if group_id]
+        targets.extend((MessageType.FRIEND_MESSAGE, str(user_id)) for user_id in test_targets.get("user_ids", []) if user_id)
+        return targets
+
+    async def _send_test_message(self, platform_names: list[str], message_type: MessageType, target_id: str, chain: list) -> bool:
+        """
+        依次尝试通过各平台向单个测试目标发送消息，任一平台发送成功即返回 True。
+        """
+        target_label = "群组" if message_type == MessageType.GROUP_MESSAGE else "用户"
+        for platform_name in platform_names:
+            session_str = f"{platform_name}:{message_type.value}:{target_id}"
+            try:
+                if await self.context.send_message(session_str, chain):
+                    self.logger.info(f"测试祝福已发送到{target_label} {target_id} (平台: {platform_name})")
+                    return True
+            except Exception as e:
+                self.logger.warning(f"尝试通过平台 {platform_name} 发送测试祝福到{target_label} {target_id} 失败: {e}")
+        self.logger.error(f"发送测试祝福到{target_label} {target_id} 失败: 所有平台都无法发送。")
+        return False
+
     async def load_reference_images(self) -> list[str]:
         """
         加载并转换配置文件中指定的参考图片为base64格式。
@@ -256,19 +345,36 @@ class SendBlessingsPlugin(Star):
         if not self.reference_images_enabled:
             return []
         
+        valid_images = list(self._stat_reference_images().items())[:self.max_reference_images]
+        valid_paths = [path for path, _ in valid_images]
+
+        # 参考图在配置不变时是静态的，文件修改时间均未变化则直接复用上次的编码结果
+        mtimes = dict(valid_images)
+        if self._reference_images_cache is not None and mtimes == self._reference_images_mtimes:
+            return self._reference_images_cache
+
         base64_images = []
-        valid_paths = self.validate_image_paths()
+        total_size = 0
         
-        for image_path in valid_paths[:self.max_reference_images]:
+        for image_path in valid_paths:
             try:
                 base64_data = await self.convert_image_to_base64(image_path)
-                if base64_data:
-                    base64_images.append(base64_data)
+                if not base64_data:
+                    continue
+                # 参考图会随每次请求完整上传，加入后会超出总量上限的图片直接跳过
+                if total_size + len(base64_data) > REFERENCE_IMAGES_MAX_TOTAL_SIZE:
+                    self.logger.warning(f"加入参考图 {image_path} 后将超出总大小上限 ({REFERENCE_IMAGES_MAX_TOTAL_SIZE/1024/1024:.0f}MB)，已跳过。")
+                    continue
+                base64_images.append(base64_data)
+                total_size += len(base64_data)
             except Exception as e:
                 self.logger.warning(f"加载参考图 {image_path} 失败: {e}")
         
         if base64_images:
             self.logger.info(f"成功加载 {len(base64_images)} 张参考图")
+
+        self._reference_images_cache = base64_images
+        self._reference_images_mtimes = mtimes
         
         return base64_images
 
@@ -279,15 +385,24 @@ class SendBlessingsPlugin(Star):
         Returns:
             list[str]: 有效的图片绝对路径列表。
         """
-        valid_paths = []
+        return list(self._stat_reference_images())
+
+    def _stat_reference_images(self) -> dict[str, float]:
+        """
+        对每个配置的参考图路径只执行一次 stat，返回有效图片绝对路径到修改时间的映射。
+        """
+        valid_images = {}
         for path in self.reference_image_paths:
-            full_path = path if os.path.isabs(path) else os.path.join(os.path.dirname(__file__), path)
-            
-            if os.path.exists(full_path) and os.path.isfile(full_path):
-                valid_paths.append(full_path)
+            full_path = path if os.path.isabs(path) else os.path.join(PLUGIN_DIR, path)
+            try:
+                st = os.stat(full_path)
+            except OSError:
+                st = None
+            if st is not None and stat.S_ISREG(st.st_mode):
+                valid_images[full_path] = st.st_mtime
             else:
                 self.logger.warning(f"配置的参考图路径不存在: {path}")
-        return valid_paths
+        return valid_images
 
     async def convert_image_to_base64(self, image_path: str) -> str | None:
         """
@@ -306,13 +421,13 @@ class SendBlessingsPlugin(Star):
             if len(image_data) > 5 * 1024 * 1024:  # 5MB
                 self.logger.warning(f"参考图 {image_path} 过大 ({len(image_data)/1024/1024:.1f}MB)，可能导致API请求失败。")
             
-            base64_data = base64.b64encode(image_data).decode('utf-8')
+            # base64 输出为纯ASCII，使用 ascii 解码即可
+            base64_data = base64.b64encode(image_data).decode('ascii')
             
             # 根据文件扩展名确定MIME类型
             ext = os.path.splitext(image_path)[1].lower()
-            mime_map = {'.png': 'image/png', '.jpg': 'image/jpeg', '.jpeg': 'image/jpeg', '.gif': 'image/gif', '.webp': 'image/webp'}
-            mime_type = mime_map.get(ext, 'image/png')
-            if ext not in mime_map:
+            mime_type = MIME_BY_EXT.get(ext, 'image/png')
+            if ext not in MIME_BY_EXT:
                 self.logger.warning(f"未知的参考图格式 '{ext}'，将使用默认的 'image/png' MIME类型。")
             
             return f"data:{mime_type};base64,{base64_data}"
@@ -321,7 +436,7 @@ class SendBlessingsPlugin(Star):
             self.logger.error(f"转换图片 {image_path} 为base64失败: {e}")
             return None
 
-    def build_reference_prompt(self, blessing: str, holiday_name: str, has_reference: bool) -> str:
+    def build_reference_prompt(self, holiday_name: str, has_reference: bool) -> str:
         """
         构建用于图像生成的最终提示词。
 
@@ -330,7 +445,6 @@ class SendBlessingsPlugin(Star):
         - 如果有参考图，会调整提示词以指导模型在参考图基础上创作。
 
         Args:
-            blessing (str): 生成的祝福语（当前版本未使用，但保留以备将来扩展）。
             holiday_name (str): 节日名称。
             has_reference (bool): 是否有参考图。
 
@@ -338,7 +452,7 @@ class SendBlessingsPlugin(Star):
             str: 构建好的最终提示词。
         """
         base_prompt = f"{holiday_name} festival celebration, warm and festive style, cartoon illustration. Incorporate holiday elements like lanterns, flowers, or snowflakes. High quality, rich festive atmosphere."
-        negative_prompt = "IMPORTANT: Do NOT generate any text, words, letters, characters, flags, national emblems, or religious symbols. The image must be purely visual and contain no writing."
+        negative_prompt = self._IMAGE_NEGATIVE_PROMPT
 
         if has_reference:
             return (
@@ -357,6 +471,15 @@ class SendBlessingsPlugin(Star):
         """
         插件终止时调用的清理方法。
         """
+        tasks = [t for t in (*self._background_tasks, self._preload_task) if t and not t.done()]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._background_tasks.clear()
+        # 仅在图像生成模块已被加载时关闭其共享的HTTP会话，避免终止时额外导入 aiohttp
+        ttp = sys.modules.get(f"{__package__}.utils.ttp")
+        if ttp is not None:
+            await ttp.close_session()
         self.logger.info("节假日祝福插件已销毁。")
     
     async def daily_blessing_checker(self):
@@ -374,24 +497,30 @@ class SendBlessingsPlugin(Star):
                 wait_seconds = (target_time - now).total_seconds()
                 
                 self.logger.info(f"下一次每日祝福检查将在 {target_time.strftime('%Y-%m-%d %H:%M:%S')} 进行，等待 {wait_seconds:.0f} 秒。")
-                await asyncio.sleep(wait_seconds)
+                await self._sleep_until(target_time)
                 # --- --------------------------- ---
 
-                today = datetime.now().date()
-                today_info = next((h for h in self.holidays if h['date'] == today.isoformat()), None)
+                today_iso = self._today_key()
+                today = self._today_iso_day
+                await self._ensure_holidays_year(today.year)
+
+                # 从12月15日起在后台预生成下一年的数据，元旦切换年份时直接读取预生成文件
+                if (today.month == 12 and today.day >= PRELOAD_START_DAY
+                        and not os.path.exists(self._preload_file(today.year + 1))
+                        and (self._preload_task is None or self._preload_task.done())):
+                    self._preload_task = asyncio.create_task(self._preload_next_year(today.year + 1))
                 
-                if today_info and today_info['is_first_day'] and today_info['is_holiday'] and self.config.get('enabled', True):
-                    holiday_name = today_info['holiday_name']
+                if today_iso in self._first_day_dates and self.config.get('enabled', True):
+                    holiday_name = self._holidays_by_date[today_iso]['holiday_name']
                     self.logger.info(f"检测到假期第一天：{holiday_name}，开始发送祝福...")
                     
-                    blessing = await self.generate_blessing(holiday_name)
+                    blessing, image_path = await self._generate_blessing_with_image(self.generate_blessing(holiday_name), holiday_name)
                     if not blessing:
                         self.logger.error("祝福语生成失败，跳过本次发送。")
                         continue
                     
                     chain = [Comp.Plain(blessing)]
                     if self.config.get('generate_images_enabled', True):
-                        image_url, image_path = await self.generate_image(blessing, holiday_name)
                         if image_path:
                             chain.append(Comp.Image.fromFileSystem(image_path))
                         else:
@@ -399,66 +528,143 @@ class SendBlessingsPlugin(Star):
                             chain.append(Comp.Plain("\n(图片生成失败)"))
                     
                     # --- 平台无关的广播逻辑 ---
-                    sent_count = 0
-                    all_platforms = self.context.platform_manager.get_insts()
-                    for platform in all_platforms:
-                        # 仅针对支持 get_client 和 call_action 的平台 (如 aiocqhttp)
-                        if not hasattr(platform, "get_client") or not platform.get_client() or not hasattr(platform.get_client().api, "call_action"):
-                            continue
-                        
-                        self.logger.info(f"正在通过平台 '{platform.meta.name}' 进行广播...")
-                        client = platform.get_client()
-                        
-                        try:
-                            friend_list = await client.api.call_action("get_friend_list")
-                            group_list = await client.api.call_action("get_group_list")
-
-                            # 发送到好友
-                            for friend in friend_list:
-                                user_id = friend.get('user_id')
-                                if not user_id: continue
-                                session_str = f"{platform.meta.name}:{MessageType.FRIEND_MESSAGE.value}:{user_id}"
-                                try:
-                                    await self.context.send_message(session_str, chain)
-                                    sent_count += 1
-                                    self.logger.info(f"祝福消息已发送到用户 {user_id}")
-                                    await asyncio.sleep(5)
-                                except Exception as e:
-                                    self.logger.error(f"发送祝福到用户 {user_id} 失败: {e}")
-                            
-                            # 发送到群组
-                            for group in group_list:
-                                group_id = group.get('group_id')
-                                if not group_id: continue
-                                session_str = f"{platform.meta.name}:{MessageType.GROUP_MESSAGE.value}:{group_id}"
-                                try:
-                                    await self.context.send_message(session_str, chain)
-                                    sent_count += 1
-                                    self.logger.info(f"祝福消息已发送到群组 {group_id}")
-                                    await asyncio.sleep(5)
-                                except Exception as e:
-                                    self.logger.error(f"发送祝福到群组 {group_id} 失败: {e}")
-                        except Exception as e:
-                            self.logger.error(f"从平台 '{platform.meta.name}' 获取好友/群组列表失败: {e}")
+                    sent_count = await self._broadcast(chain, "祝福消息", interval=5)
 
                     if sent_count > 0:
                         self.logger.info(f"今日({holiday_name})祝福已成功发送到 {sent_count} 个会话。")
                     else:
                         self.logger.warning("未能获取到任何好友或群组，今日祝福未发送。")
                 
-                if today.month == 12 and today.day == 31:
-                    next_year = today.year + 1
-                    self.logger.info(f"正在预加载 {next_year} 年的节假日数据...")
-                    self.holidays = await self._get_year_holidays(next_year)
-                    self._save_holidays_to_json(next_year, self.holidays, self.json_file)
-                
             except asyncio.CancelledError:
                 self.logger.info("每日祝福检查任务被取消。")
                 break
             except Exception as e:
                 self.logger.error(f"每日祝福检查任务发生严重错误: {e}")
-                await asyncio.sleep(3600)
+                await asyncio.sleep(self._seconds_until_next_hour())
     
+    async def _get_platform_sessions(self, platform) -> list[str]:
+        """
+        获取单个平台上所有好友和群组的会话字符串。
+
+        仅支持提供 get_client 和 call_action 的平台 (如 aiocqhttp)，其余平台返回空列表。
+        """
+        if not hasattr(platform, "get_client") or not platform.get_client() or not hasattr(platform.get_client().api, "call_action"):
+            return []
+
+        client = platform.get_client()
+        try:
+            friend_list, group_list = await asyncio.gather(
+                client.api.call_action("get_friend_list"),
+                client.api.call_action("get_group_list")
+            )
+        except Exception as e:
+            self.logger.error(f"从平台 '{platform.meta.name}' 获取好友/群组列表失败: {e}")
+            return []
+
+        sessions = [
+            f"{platform.meta.name}:{MessageType.FRIEND_MESSAGE.value}:{friend['user_id']}"
+            for friend in friend_list if friend.get('user_id')
+        ]
+        sessions.extend(
+            f"{platform.meta.name}:{MessageType.GROUP_MESSAGE.value}:{group['group_id']}"
+            for group in group_list if group.get('group_id')
+        )
+        return sessions
+
+    async def _broadcast(self, chain: list, label: str, interval: float) -> int:
+        """
+        向所有平台的好友和群组广播消息。
+
+        各平台的好友/群组列表并发获取。发送时最多同时进行 `MAX_CONCURRENT_SENDS` 个，
+        每个发送完成后仍等待固定间隔再释放名额，避免触发平台风控。
+
+        Args:
+            chain (list): 要发送的消息链。
+            label (str): 日志中使用的消息名称，例如 "祝福消息"。
+            interval (float): 两次发送之间的等待秒数。
+
+        Returns:
+            int: 成功发送的会话数量。
+        """
+        platforms = self.context.platform_manager.get_insts()
+        platform_sessions = await asyncio.gather(*(self._get_platform_sessions(p) for p in platforms))
+
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_SENDS)
+
+        async def send(session_str: str) -> bool:
+            async with semaphore:
+                try:
+                    await self.context.send_message(session_str, chain)
+                    self.logger.info(f"{label}已发送到 {session_str}")
+                    return True
+                except Exception as e:
+                    self.logger.error(f"发送{label}到 {session_str} 失败: {e}")
+                    return False
+                finally:
+                    await asyncio.sleep(interval)
+
+        all_sessions = []
+        for platform, sessions in zip(platforms, platform_sessions):
+            if sessions:
+                self.logger.info(f"正在通过平台 '{platform.meta.name}' 发送{label}...")
+                all_sessions.extend(sessions)
+
+        results = await asyncio.gather(*(send(session_str) for session_str in all_sessions))
+        return sum(results)
+
+    def _preload_file(self, year: int) -> Path:
+        """
+        返回预生成的指定年份节假日数据文件路径，例如 holidays_2027.json。
+        """
+        return self.json_file.with_name(f"{self.json_file.stem}_{year}{self.json_file.suffix}")
+
+    async def _preload_next_year(self, year: int):
+        """
+        在后台生成下一年的节假日数据并保存到年份专用文件，文件写入在线程中执行以免阻塞事件循环。
+
+        当前使用的数据保持不变，直到跨年后由 `_ensure_holidays_year` 切换。
+        """
+        try:
+            self.logger.info(f"正在预加载 {year} 年的节假日数据...")
+            holidays = await self._get_year_holidays(year)
+            await asyncio.to_thread(self._save_holidays_to_json, year, holidays, self._preload_file(year))
+        except Exception as e:
+            self.logger.error(f"预加载 {year} 年节假日数据失败: {e}")
+
+    async def _ensure_holidays_year(self, year: int):
+        """
+        跨年后将内存中的节假日数据切换到指定年份。
+        """
+        if self._holidays_year == year:
+            return
+        self.logger.info(f"检测到年份变更为 {year}，正在切换节假日数据...")
+        try:
+            self._set_holidays(await self._get_current_year_holidays(self.json_file))
+            self._print_holidays_summary(self.holidays, year)
+        except Exception as e:
+            self.logger.error(f"切换到 {year} 年节假日数据失败: {e}")
+
+    @staticmethod
+    async def _sleep_until(target_time: datetime):
+        """
+        等待到指定的本地时间。
+
+        `asyncio.sleep` 基于单调时钟计时，不受系统时间调整影响；每段睡眠最长一小时，
+        醒来后再用墙上时钟确认是否已到达目标时间。系统时间回拨时会继续等待剩余时间，
+        时间前跳（如挂起后恢复）时最多延迟一小时即可察觉。
+        """
+        while (remaining := (target_time - datetime.now()).total_seconds()) > 0:
+            await asyncio.sleep(min(remaining, 3600))
+
+    @staticmethod
+    def _seconds_until_next_hour() -> float:
+        """
+        计算距离下一个整点的秒数，用于后台任务出错后的重试等待。
+        """
+        now = datetime.now()
+        next_hour = now.replace(minute=0, second=0, microsecond=0) + timedelta(hours=1)
+        return (next_hour - now).total_seconds()
+
     async def generate_blessing(self, holiday_name: str) -> str:
         """
         生成节日祝福语。
@@ -472,6 +678,14 @@ class SendBlessingsPlugin(Star):
         Returns:
             str: 生成的祝福语。
         """
+        canonical_name = HOLIDAY_ALIASES.get(holiday_name.strip(), holiday_name.strip())
+        cache_key = (canonical_name, self._today_key())
+        cached = self._blessing_cache.get(cache_key)
+        if cached:
+            self._blessing_cache.move_to_end(cache_key)
+            self.logger.info(f"使用缓存的 {holiday_name} 祝福语。")
+            return cached
+
         try:
             # 尝试使用LLM生成
             try:
@@ -481,31 +695,28 @@ class SendBlessingsPlugin(Star):
                     
                     resp = await provider.text_chat(
                         prompt=prompt,
-                        system_prompt="你是一个专业的节日祝福生成器，你的回答应该只包含祝福语文本本身，不要添加任何额外的解释或引言。"
+                        system_prompt=self._BLESSING_SYSTEM_PROMPT
                     )
                     
                     if resp and resp.completion_text:
                         blessing = resp.completion_text.strip()
                         if blessing and len(blessing) > 10:
                             self.logger.info(f"成功使用LLM为 {holiday_name} 生成祝福语。")
+                            self._blessing_cache[cache_key] = blessing
+                            if len(self._blessing_cache) > BLESSING_CACHE_SIZE:
+                                self._blessing_cache.popitem(last=False)
+                            self._save_blessing_cache()
                             return blessing
             except Exception as e:
                 self.logger.warning(f"LLM生成祝福语失败，将使用预设模板: {e}")
             
             # LLM失败或未配置，回退到模板
-            blessing_templates = {
-                "春节": "新春快乐！祝您在新的一年里龙马精神，万事如意，阖家幸福！",
-                "元旦": "元旦快乐！新年新气象，愿您在新的一年里梦想成真，步步高升！",
-                "中秋节": "中秋节快乐！月圆人团圆，祝您和家人幸福美满，共享天伦之乐！",
-                "国庆节": "国庆节快乐！祝愿我们伟大的祖国繁荣昌盛，祝您节日愉快，笑口常开！",
-                "劳动节": "劳动节快乐！向所有辛勤的劳动者致敬，祝您度过一个轻松愉快的假期！",
-                "端午节": "端午安康！愿粽叶的清香带给您好运，祝您身体健康，平安吉祥！",
-                "清明节": "清明时节，缅怀先人，珍惜当下。愿逝者安息，生者奋发。",
-                "元宵节": "元宵节快乐！愿您人圆事圆花好月圆，甜甜蜜蜜，幸福团圆！"
-            }
-            for key in blessing_templates:
+            template = BLESSING_TEMPLATES.get(canonical_name)
+            if template:
+                return template
+            for key, template in BLESSING_TEMPLATES.items():
                 if key in holiday_name:
-                    return blessing_templates[key]
+                    return template
             
             # 通用回退
             return f"祝您{holiday_name}快乐，万事顺心，阖家安康！"
@@ -514,15 +725,37 @@ class SendBlessingsPlugin(Star):
             self.logger.error(f"生成祝福语时发生未知错误: {e}")
             return f"祝您{holiday_name}快乐！"
     
-    async def generate_image(self, blessing: str, holiday_name: str, cmd_ref_images: list[str] = None) -> tuple[str | None, str | None]:
+    async def _generate_blessing_with_image(self, blessing_coro, holiday_name: str) -> tuple[str, str | None]:
+        """
+        并发生成祝福语和节日图片。
+
+        图片提示词只依赖节日名称，因此无需等待LLM返回祝福语即可开始请求图片，
+        两个网络请求可以重叠进行。
+
+        Args:
+            blessing_coro: 生成祝福语的协程，例如 `self.generate_blessing(holiday_name)`。
+            holiday_name (str): 节日名称，用于构建图片提示词。
+
+        Returns:
+            tuple[str, str | None]: (祝福语, 图片路径)。未启用图片生成或生成失败时图片路径为None。
+        """
+        if not self.config.get('generate_images_enabled', True):
+            return await blessing_coro, None
+
+        blessing, (image_url, image_path) = await asyncio.gather(
+            blessing_coro,
+            self.generate_image(holiday_name)
+        )
+        return blessing, image_path
+
+    async def generate_image(self, holiday_name: str, cmd_ref_images: list[str] = None) -> tuple[str | None, str | None]:
         """
         生成并保存节日祝福图片。
 
         调用 `utils.ttp.generate_image_openrouter` 函数执行生成，并处理后续的
-        文件传输（如果配置了NAP服务器）。
+        文件传输（如果配置了NAP服务器）。图片提示词只依赖节日名称，与祝福语内容无关。
 
         Args:
-            blessing (str): 生成的祝福语，用于构建提示词。
             holiday_name (str): 节日名称，用于构建提示词。
             cmd_ref_images (list[str], optional): 从指令中直接提供的参考图 (base64-encoded). Defaults to None.
 
@@ -530,9 +763,21 @@ class SendBlessingsPlugin(Star):
             tuple[str | None, str | None]: 成功时返回(图片URL, 图片本地/远程路径)，失败时返回(None, None)。
         """
         try:
+            if not holiday_name:
+                return None, None
             if not self.openrouter_api_keys:
                 self.logger.warning("未配置OpenRouter API密钥，跳过图片生成。")
                 return None, None
+
+            # 同一天内同一节日的图片直接复用（仅缓存在内存中），本地文件已被清理时重新生成
+            cache_key = None
+            if not cmd_ref_images:
+                cache_key = (holiday_name, self._today_key())
+                cached = self._image_cache.get(cache_key)
+                if cached and os.path.exists(cached[2]):
+                    self._image_cache.move_to_end(cache_key)
+                    self.logger.info(f"使用缓存的 {holiday_name} 节日图片: {cached[1]}")
+                    return cached[0], cached[1]
             
             # 1. 确定要使用的参考图
             # 优先使用从指令传入的参考图
@@ -544,25 +789,31 @@ class SendBlessingsPlugin(Star):
                 reference_images = await self.load_reference_images()
             
             # 2. 构建最终的图像生成提示词
-            prompt = self.build_reference_prompt(blessing, holiday_name, bool(reference_images))
+            prompt = self.build_reference_prompt(holiday_name, bool(reference_images))
             
-            # 3. 调用图像生成函数
-            image_url, image_path = await generate_image_openrouter(
-                prompt=prompt,
-                api_keys=self.openrouter_api_keys,
-                model=self.model_name,
-                data_dir=self.plugin_data_dir,
-                input_images=reference_images,
-                max_retry_attempts=self.max_retry_attempts,
-                api_base=self.custom_api_base if self.custom_api_base else None
-            )
+            # 3. 调用图像生成函数，限制并发请求数以免触发上游速率限制
+            # 图像生成模块 (aiohttp 等) 仅在真正需要生成图片时才导入
+            from .utils.ttp import generate_image_openrouter
+            async with self._image_semaphore:
+                image_url, image_path = await generate_image_openrouter(
+                    prompt=prompt,
+                    api_keys=self.openrouter_api_keys,
+                    model=self.model_name,
+                    data_dir=self.plugin_data_dir,
+                    input_images=reference_images,
+                    max_retry_attempts=self.max_retry_attempts,
+                    api_base=self.custom_api_base if self.custom_api_base else None
+                )
             
             if not image_url or not image_path:
                 self.logger.error("图片生成失败。")
                 return None, None
             
+            local_path = image_path
+
             # 4. 如果配置了NAP服务器，则将文件传输到远程
-            if self.nap_server_address and self.nap_server_address != "localhost":
+            if self._use_nap:
+                from .utils.file_send_server import send_file
                 try:
                     transferred_path = await send_file(image_path, host=self.nap_server_address, port=self.nap_server_port)
                     if transferred_path:
@@ -573,6 +824,11 @@ class SendBlessingsPlugin(Star):
                 except Exception as e:
                     self.logger.warning(f"NAP文件传输失败，将使用本地路径: {e}")
             
+            if cache_key:
+                self._image_cache[cache_key] = (image_url, image_path, local_path)
+                if len(self._image_cache) > IMAGE_CACHE_SIZE:
+                    self._image_cache.popitem(last=False)
+
             self.logger.info(f"节日图片已准备就绪: {image_path}")
             return image_url, image_path
             
@@ -599,7 +855,7 @@ class SendBlessingsPlugin(Star):
                     
                     resp = await provider.text_chat(
                         prompt=prompt,
-                        system_prompt="你是一个善于鼓励和给予温暖祝福的AI助手。你的回答应该只包含祝福语文本本身，不要添加任何额外的解释或引言。"
+                        system_prompt=self._END_OF_HOLIDAY_SYSTEM_PROMPT
                     )
                     
                     if resp and resp.completion_text:
@@ -635,70 +891,32 @@ class SendBlessingsPlugin(Star):
                 
                 wait_seconds = (send_time - now).total_seconds()
                 self.logger.info(f"下一次假期结束检查将在 {send_time.strftime('%Y-%m-%d %H:%M:%S')} 进行，等待 {wait_seconds:.0f} 秒。")
-                await asyncio.sleep(wait_seconds)
+                await self._sleep_until(send_time)
 
-                today = datetime.now().date()
-                today_info = next((h for h in self.holidays if h['date'] == today.isoformat()), None)
+                today_iso = self._today_key()
+                await self._ensure_holidays_year(self._today_iso_day.year)
+                today_info = self._holidays_by_date.get(today_iso)
 
                 if today_info and today_info['is_last_day']:
                     holiday_name = today_info['holiday_name']
                     self.logger.info(f"检测到假期最后一天：{holiday_name}，准备发送结束提醒...")
 
-                    # 1. 生成祝福语
-                    blessing = await self.generate_end_of_holiday_blessing(holiday_name)
+                    # 1. 并发生成祝福语和图片
+                    blessing, image_path = await self._generate_blessing_with_image(
+                        self.generate_end_of_holiday_blessing(holiday_name), holiday_name
+                    )
                     
-                    # 2. 生成图片
-                    # 3. 构建消息链
+                    # 2. 构建消息链
                     chain = [Comp.Plain(blessing)]
                     if self.config.get('generate_images_enabled', True):
-                        image_url, image_path = await self.generate_image(blessing, holiday_name)
                         if image_path:
                             chain.append(Comp.Image.fromFileSystem(image_path))
                         else:
                             self.logger.error("假期结束提醒的图片生成失败，将只发送文字。")
                             chain.append(Comp.Plain("\n(图片生成失败)"))
 
-                    # 4. 发送到所有目标会话
-                    sent_count = 0
-                    all_platforms = self.context.platform_manager.get_insts()
-                    for platform in all_platforms:
-                        if not hasattr(platform, "get_client") or not platform.get_client() or not hasattr(platform.get_client().api, "call_action"):
-                            continue
-                        
-                        self.logger.info(f"正在通过平台 '{platform.meta.name}' 发送假期结束提醒...")
-                        client = platform.get_client()
-                        
-                        try:
-                            friend_list = await client.api.call_action("get_friend_list")
-                            group_list = await client.api.call_action("get_group_list")
-
-                            # 发送到好友
-                            for friend in friend_list:
-                                user_id = friend.get('user_id')
-                                if not user_id: continue
-                                session_str = f"{platform.meta.name}:{MessageType.FRIEND_MESSAGE.value}:{user_id}"
-                                try:
-                                    await self.context.send_message(session_str, chain)
-                                    sent_count += 1
-                                    self.logger.info(f"假期结束提醒已发送到用户 {user_id}")
-                                    await asyncio.sleep(3)
-                                except Exception as e:
-                                    self.logger.error(f"发送假期结束提醒到用户 {user_id} 失败: {e}")
-                            
-                            # 发送到群组
-                            for group in group_list:
-                                group_id = group.get('group_id')
-                                if not group_id: continue
-                                session_str = f"{platform.meta.name}:{MessageType.GROUP_MESSAGE.value}:{group_id}"
-                                try:
-                                    await self.context.send_message(session_str, chain)
-                                    sent_count += 1
-                                    self.logger.info(f"假期结束提醒已发送到群组 {group_id}")
-                                    await asyncio.sleep(3)
-                                except Exception as e:
-                                    self.logger.error(f"发送假期结束提醒到群组 {group_id} 失败: {e}")
-                        except Exception as e:
-                            self.logger.error(f"从平台 '{platform.meta.name}' 获取好友/群组列表失败: {e}")
+                    # 3. 发送到所有目标会话
+                    sent_count = await self._broadcast(chain, "假期结束提醒", interval=3)
 
                     if sent_count > 0:
                         self.logger.info(f"假期结束提醒已成功发送到 {sent_count} 个会话。")
@@ -710,7 +928,28 @@ class SendBlessingsPlugin(Star):
                 break
             except Exception as e:
                 self.logger.error(f"假期结束提醒任务发生严重错误: {e}")
-                await asyncio.sleep(3600) # 出错时等待1小时后重试
+                await asyncio.sleep(self._seconds_until_next_hour()) # 出错时等到下一个整点后重试
+
+    def _today_key(self) -> str:
+        """
+        返回今天日期的ISO字符串 (YYYY-MM-DD)，同一天内复用已格式化的结果。
+        """
+        today = date.today()
+        if today != self._today_iso_day:
+            self._today_iso_day = today
+            self._today_iso = today.isoformat()
+        return self._today_iso
+
+    def _set_holidays(self, holidays: list):
+        """
+        更新节假日数据，并重建按日期索引的查找表和假期首日集合。
+        """
+        self.holidays = holidays
+        self._holidays_year = int(holidays[0]['date'][:4]) if holidays else None
+        self._holidays_by_date = {h['date']: h for h in holidays}
+        self._first_day_dates = frozenset(
+            d for d, h in self._holidays_by_date.items() if h.get('is_first_day') and h.get('is_holiday')
+        )
 
     def _load_holidays_from_json(self, json_file: str) -> tuple[int | None, list]:
         """
@@ -718,15 +957,25 @@ class SendBlessingsPlugin(Star):
         """
         if json_file is None:
             json_file = 'holidays.json'
-        if os.path.exists(json_file):
-            try:
-                with open(json_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    return data.get('year'), data.get('holidays', [])
-            except Exception as e:
-                self.logger.error(f"从 {json_file} 加载节假日数据失败: {e}")
-                return None, []
-        return None, []
+        try:
+            mtime = os.stat(json_file).st_mtime
+        except OSError:
+            return None, []
+
+        cache = self._holidays_file_cache
+        if cache['path'] == str(json_file) and cache['mtime'] == mtime:
+            return cache['year'], cache['data']
+
+        try:
+            with open(json_file, 'rb') as f:
+                raw = f.read()
+            data = orjson.loads(raw) if orjson else json.loads(raw)
+            year, holidays = data.get('year'), data.get('holidays', [])
+            cache.update(path=str(json_file), mtime=mtime, year=year, data=holidays)
+            return year, holidays
+        except Exception as e:
+            self.logger.error(f"从 {json_file} 加载节假日数据失败: {e}")
+            return None, []
 
     def _save_holidays_to_json(self, year: int, holidays: list, json_file: str):
         """
@@ -736,12 +985,73 @@ class SendBlessingsPlugin(Star):
             json_file = 'holidays.json'
         data = {'year': year, 'holidays': holidays}
         try:
-            with open(json_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
+            # 文件仅供插件自身读取，使用紧凑格式写入
+            if orjson:
+                with open(json_file, 'wb') as f:
+                    f.write(orjson.dumps(data))
+            else:
+                with open(json_file, 'w', encoding='utf-8') as f:
+                    json.dump(data, f, ensure_ascii=False, separators=(',', ':'))
+            self._holidays_file_cache['mtime'] = None
             self.logger.info(f"节假日数据已保存到 {json_file}")
         except Exception as e:
             self.logger.error(f"保存节假日数据到 {json_file} 失败: {e}")
 
+    def _load_blessing_cache(self) -> OrderedDict[tuple[str, str], str]:
+        """
+        从磁盘加载当天的LLM祝福语缓存，过期日期的条目直接丢弃。
+        """
+        cache = OrderedDict()
+        if not os.path.exists(self.blessing_cache_file):
+            return cache
+        today_iso = self._today_key()
+        try:
+            with open(self.blessing_cache_file, 'r', encoding='utf-8') as f:
+                entries = json.load(f)
+            for holiday_name, day, blessing in entries:
+                if day == today_iso:
+                    cache[(holiday_name, day)] = blessing
+        except Exception as e:
+            self.logger.warning(f"加载祝福语缓存失败: {e}")
+        return cache
+
+    def _save_blessing_cache(self):
+        """
+        将LLM祝福语缓存原子地写入磁盘（先写临时文件再替换）。
+        """
+        entries = [[holiday_name, day, blessing] for (holiday_name, day), blessing in self._blessing_cache.items()]
+        tmp_file = self.blessing_cache_file.with_name(self.blessing_cache_file.name + '.tmp')
+        try:
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                json.dump(entries, f, ensure_ascii=False)
+            os.replace(tmp_file, self.blessing_cache_file)
+        except Exception as e:
+            self.logger.warning(f"保存祝福语缓存失败: {e}")
+
+    def _load_translation_cache(self) -> dict[str, str]:
+        """
+        从磁盘加载已持久化的节假日名称翻译。
+        """
+        if not os.path.exists(self.translations_file):
+            return {}
+        try:
+            with open(self.translations_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            return data if isinstance(data, dict) else {}
+        except Exception as e:
+            self.logger.warning(f"加载节假日名称翻译缓存失败: {e}")
+            return {}
+
+    def _save_translation_cache(self, translations: dict[str, str]):
+        """
+        将节假日名称翻译持久化到磁盘，供后续年份直接复用。
+        """
+        try:
+            with open(self.translations_file, 'w', encoding='utf-8') as f:
+                json.dump(translations, f, ensure_ascii=False, separators=(',', ':'))
+        except Exception as e:
+            self.logger.warning(f"保存节假日名称翻译缓存失败: {e}")
+
     async def _translate_holiday_names_batch(self, holiday_names: set) -> dict[str, str]:
         """
         使用LLM批量翻译节假日名称。
@@ -749,8 +1059,13 @@ class SendBlessingsPlugin(Star):
         if not holiday_names:
             return {}
 
-        # 构建原始名称到自身的映射，作为翻译失败时的后备
-        translations = {name: name for name in holiday_names}
+        # 构建原始名称到自身的映射，作为翻译失败时的后备，已缓存的翻译直接复用
+        cached_translations = await asyncio.to_thread(self._load_translation_cache)
+        translations = {name: cached_translations.get(name, name) for name in holiday_names}
+        names_to_translate = [name for name in holiday_names if name not in cached_translations]
+        if not names_to_translate:
+            self.logger.info(f"全部 {len(holiday_names)} 个节假日名称已命中翻译缓存。")
+            return translations
         
         try:
             provider = self.context.get_using_provider()
@@ -758,8 +1073,7 @@ class SendBlessingsPlugin(Star):
                 self.logger.warning("未找到可用的大语言模型提供商，跳过翻译。")
                 return translations
 
-            # 构建prompt
-            names_to_translate = list(holiday_names)
+            # 构建prompt，只翻译缓存中没有的名称
             prompt = (
                 "请将以下英文节假日名称列表翻译成简体中文。请严格按照JSON格式返回一个字典，"
                 "其中键是原始的英文名称，值是对应的中文翻译。\n"
@@ -768,10 +1082,8 @@ class SendBlessingsPlugin(Star):
                 f"要翻译的名称: {json.dumps(names_to_translate, ensure_ascii=False)}"
             )
             
-            system_prompt = "你是一个专业的翻译引擎，专门将节假日名称从英文翻译成中文，并以JSON格式返回结果。"
-
             # 调用LLM
-            resp = await provider.text_chat(prompt=prompt, system_prompt=system_prompt)
+            resp = await provider.text_chat(prompt=prompt, system_prompt=self._TRANSLATION_SYSTEM_PROMPT)
 
             if resp and resp.completion_text:
                 self.logger.debug(f"LLM原始返回: {resp.completion_text}")
@@ -795,6 +1107,8 @@ class SendBlessingsPlugin(Star):
                         for name, translated in llm_translations.items():
                             if name in translations and translated:
                                 translations[name] = translated
+                                cached_translations[name] = translated
+                        await asyncio.to_thread(self._save_translation_cache, cached_translations)
                         self.logger.info(f"成功批量翻译 {len(llm_translations)} 个节假日名称。")
                     else:
                         self.logger.warning("LLM返回的不是一个有效的JSON字典。")
@@ -813,38 +1127,43 @@ class SendBlessingsPlugin(Star):
 
     async def _get_year_holidays(self, year: int) -> list:
         """
-        获取指定年份的完整节假日信息，采用批量翻译。
+        获取指定年份的完整节假日信息，未知节日名称采用批量翻译。
         """
-        start_date = date(year, 1, 1)
-        end_date = date(year, 12, 31)
-        current_date = start_date
-        
-        # 第一次循环：收集所有需要翻译的节假日名称
-        holiday_names_to_translate = set()
-        raw_holiday_data = []
+        # 调用一次库函数以校验年份是否受 chinese_calendar 支持（不支持时抛出 NotImplementedError）
+        ch_calendar.get_holiday_detail(date(year, 12, 31))
+
+        # 直接使用 chinese_calendar 的底层字典，避免每天调用四个库函数
+        holidays_map = ch_calendar.constants.holidays
+
+        # 收集当年的节假日名称，已知节日直接使用内置中文名，其余才交给LLM批量翻译
         self.logger.info(f"正在收集 {year} 年的节假日信息...")
-        while current_date <= end_date:
-            on_holiday, holiday_name = ch_calendar.get_holiday_detail(current_date)
-            raw_holiday_data.append({'date': current_date, 'on_holiday': on_holiday, 'holiday_name': holiday_name})
-            if on_holiday and holiday_name:
-                holiday_names_to_translate.add(holiday_name)
-            current_date += timedelta(days=1)
+        year_holiday_names = {name for d, name in holidays_map.items() if d.year == year and name}
+        translated_names = {name: HOLIDAY_ZH[name] for name in year_holiday_names if name in HOLIDAY_ZH}
+        translated_names.update(await self._translate_holiday_names_batch(year_holiday_names - translated_names.keys()))
 
-        # 批量翻译
-        translated_names = await self._translate_holiday_names_batch(holiday_names_to_translate)
+        # 逐日扫描为纯同步计算，放到线程中执行以免阻塞事件循环
+        return await asyncio.to_thread(self._build_year_holidays, year, translated_names)
+
+    def _build_year_holidays(self, year: int, translated_names: dict[str, str]) -> list:
+        """
+        根据已翻译的节日名称逐日构建指定年份的节假日列表。
+        """
+        start_date = date(year, 1, 1)
+        end_date = date(year, 12, 31)
+        holidays_map = ch_calendar.constants.holidays
+        workdays_map = ch_calendar.constants.workdays
+        in_lieu_map = ch_calendar.constants.in_lieu_days
 
-        # 第二次循环：构建最终的节假日列表
         holidays = []
         prev_holiday_name = None
         self.logger.info(f"正在处理和构建 {year} 年的最终节假日数据...")
-        for raw_data in raw_holiday_data:
-            current_date = raw_data['date']
-            on_holiday = raw_data['on_holiday']
-            original_holiday_name = raw_data['holiday_name']
-            
-            is_hol = is_holiday(current_date)
-            is_work = is_workday(current_date)
-            is_lieu = ch_calendar.is_in_lieu(current_date)
+        for ordinal in range(start_date.toordinal(), end_date.toordinal() + 1):
+            current_date = date.fromordinal(ordinal)
+            original_holiday_name = holidays_map.get(current_date)
+            is_work = current_date in workdays_map or (current_date.weekday() <= 4 and original_holiday_name is None)
+            is_hol = not is_work
+            is_lieu = current_date in in_lieu_map
+            on_holiday = original_holiday_name is not None
 
             translated_name = translated_names.get(original_holiday_name, original_holiday_name) if on_holiday and original_holiday_name else ''
 
@@ -865,15 +1184,18 @@ class SendBlessingsPlugin(Star):
                 if translated_name != prev_holiday_name:
                     self.logger.info(f"{current_date} 是节假日: {translated_name}")
                     if is_lieu:
-                        self.logger.info(f"  -> {current_date} 是调休日")
+                        self.logger.debug(f"  -> {current_date} 是调休日")
                     prev_holiday_name = translated_name
+
+            # 前一天是假期而今天不是，则前一天为该段假期的最后一天
+            if holidays and holidays[-1]['is_holiday'] and not is_hol:
+                holidays[-1]['is_last_day'] = True
             
             holidays.append(holiday_info)
 
-        # 标记假期的最后一天
-        for i in range(len(holidays) - 1, -1, -1):
-            if holidays[i]['is_holiday'] and (i == len(holidays) - 1 or not holidays[i+1]['is_holiday']):
-                holidays[i]['is_last_day'] = True
+        # 12月31日仍在假期中时，它即为最后一天
+        if holidays and holidays[-1]['is_holiday']:
+            holidays[-1]['is_last_day'] = True
                 
         return holidays
 
@@ -882,15 +1204,26 @@ class SendBlessingsPlugin(Star):
         获取当前年份的节假日数据，优先从缓存加载。
         """
         current_year = datetime.now().year
-        saved_year, saved_holidays = self._load_holidays_from_json(json_file)
+        saved_year, saved_holidays = await asyncio.to_thread(self._load_holidays_from_json, json_file)
 
         if saved_year == current_year and saved_holidays:
             self.logger.info(f"已从缓存加载 {current_year} 年节假日数据，共 {len(saved_holidays)} 条记录。")
             return saved_holidays
+
+        # 年末预生成的数据文件存在时直接启用，无需重新计算
+        preload_file = self._preload_file(current_year)
+        preload_year, preload_holidays = await asyncio.to_thread(self._load_holidays_from_json, preload_file)
+        if preload_year == current_year and preload_holidays:
+            try:
+                os.replace(preload_file, json_file)
+            except OSError as e:
+                self.logger.warning(f"启用预生成的节假日数据文件 {preload_file} 失败: {e}")
+            self.logger.info(f"已启用预生成的 {current_year} 年节假日数据，共 {len(preload_holidays)} 条记录。")
+            return preload_holidays
         else:
             self.logger.info(f"未找到 {current_year} 年的缓存或数据已过时，正在重新获取...")
             holidays = await self._get_year_holidays(current_year)
-            self._save_holidays_to_json(current_year, holidays, json_file)
+            await asyncio.to_thread(self._save_holidays_to_json, current_year, holidays, json_file)
             return holidays
 
     def _print_holidays_summary(self, holidays: list, year: int):
@@ -899,10 +1232,13 @@ class SendBlessingsPlugin(Star):
         """
         self.logger.info(f"--- {year} 年节假日摘要 ---")
         total_days = len(holidays)
-        holiday_count = sum(1 for h in holidays if h['is_holiday'])
-        workday_count = sum(1 for h in holidays if h['is_workday'])
-        lieu_count = sum(1 for h in holidays if h['is_in_lieu'])
-        first_day_count = sum(1 for h in holidays if h['is_first_day'])
+        # 单次遍历同时统计各项（布尔值可直接相加）
+        holiday_count = workday_count = lieu_count = first_day_count = 0
+        for h in holidays:
+            holiday_count += h['is_holiday']
+            workday_count += h['is_workday']
+            lieu_count += h['is_in_lieu']
+            first_day_count += h['is_first_day']
         self.logger.info(f"总天数: {total_days}")
         self.logger.info(f"总节假日天数: {holiday_count}")
         self.logger.info(f"总工作日天数: {workday_count}")
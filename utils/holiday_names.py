@@ -0,0 +1,12 @@
+from chinese_calendar import Holiday
+
+# chinese_calendar 英文节日名称到中文名称的映射，已知节日无需再调用LLM翻译
+HOLIDAY_ZH = {
+    Holiday.new_years_day.value: "元旦",
+    Holiday.spring_festival.value: "春节",
+    Holiday.tomb_sweeping_day.value: "清明节",
+    Holiday.labour_day.value: "劳动节",
+    Holiday.dragon_boat_festival.value: "端午节",
+    Holiday.national_day.value: "国庆节",
+    Holiday.mid_autumn_festival.value: "中秋节",
+}
@@ -1,15 +1,20 @@
 import random
 import aiohttp
 import asyncio
-import aiofiles
 import base64
+import itertools
+import json
 import os
 import re
-import uuid
-from datetime import datetime, timedelta
+import time
 from pathlib import Path
 from astrbot.api import logger
 
+try:
+    import orjson
+except ImportError:  # orjson 为可选依赖，未安装时回退到标准库 json
+    orjson = None
+
 # --- 模型特定配置 ---
 MODEL_CONFIGS = {
     "nano-banana": {
@@ -32,78 +37,185 @@ MODEL_CONFIGS = {
     }
 }
 
+# 重试退避参数：基础延迟、随机抖动比例和最大延迟（秒）
+RETRY_BASE_DELAY = 1.0
+RETRY_JITTER = 0.5
+RETRY_MAX_DELAY = 30
+
+# 聊天补全响应中内嵌的 base64 图像 data URI
+_DATA_URI_RE = re.compile(r"data:image/([^;]+);base64,([A-Za-z0-9+/=]+)")
+
 class ImageGeneratorState:
     """
-    图像生成器的状态管理类，用于在异步环境中安全地处理共享状态。
+    图像生成器的状态管理类。
+
+    各方法内部均不包含 await，在事件循环中天然是原子执行的，因此无需加锁。
     """
     def __init__(self):
         self.last_saved_image = {"url": None, "path": None}
         self.api_key_index = 0
-        self._lock = asyncio.Lock()
-    
-    async def get_next_api_key(self, api_keys: list) -> str:
-        async with self._lock:
-            if not api_keys or not isinstance(api_keys, list):
-                raise ValueError("API密钥列表不能为空")
-            return api_keys[self.api_key_index % len(api_keys)]
     
-    async def rotate_to_next_api_key(self, api_keys: list):
-        async with self._lock:
-            if api_keys and isinstance(api_keys, list) and len(api_keys) > 1:
-                self.api_key_index = (self.api_key_index + 1) % len(api_keys)
-                logger.info(f"已轮换到下一个API密钥，当前索引: {self.api_key_index}")
+    def rotate_to_next_api_key(self, api_keys: list):
+        if api_keys and isinstance(api_keys, list) and len(api_keys) > 1:
+            self.api_key_index = (self.api_key_index + 1) % len(api_keys)
+            logger.info(f"已轮换到下一个API密钥，当前索引: {self.api_key_index}")
     
-    async def update_saved_image(self, url: str, path: str):
-        async with self._lock:
-            self.last_saved_image = {"url": url, "path": path}
+    def update_saved_image(self, url: str, path: str):
+        self.last_saved_image = {"url": url, "path": path}
     
-    async def get_saved_image_info(self) -> tuple[str | None, str | None]:
-        async with self._lock:
-            return self.last_saved_image["url"], self.last_saved_image["path"]
+    def get_saved_image_info(self) -> tuple[str | None, str | None]:
+        return self.last_saved_image["url"], self.last_saved_image["path"]
 
 _state = ImageGeneratorState()
 
-async def cleanup_old_images(images_dir: Path):
-    """清理指定目录下超过15分钟的旧图像文件。"""
+# 进程内递增计数器，用于保证同一时刻保存的图像文件名唯一
+_img_counter = itertools.count()
+
+# 已创建的图像目录缓存，避免每次保存图像时重复构建路径并调用 mkdir
+_images_dirs: dict[Path, Path] = {}
+
+# 生成图像的保留时长，超过后在下次清理时删除
+IMAGE_RETENTION_SECONDS = 15 * 60
+# 两次清理之间的最短间隔
+CLEANUP_INTERVAL_SECONDS = 60
+# 参与清理的图像扩展名，须覆盖 _IMAGE_FORMATS 中所有可能的保存格式
+IMAGE_EXTENSIONS = (".png", ".jpg", ".jpeg", ".webp", ".gif")
+# MIME 子类型到保存扩展名的映射，不在其中的格式统一按 png 保存
+_IMAGE_FORMATS = {"png": "png", "jpeg": "jpg", "jpg": "jpg", "webp": "webp", "gif": "gif"}
+# 上次清理的单调时钟时间
+_last_cleanup = float("-inf")
+
+def _get_images_dir(data_dir: Path) -> Path:
+    """返回 `data_dir` 下的 images 目录，首次调用时创建并缓存。"""
+    images_dir = _images_dirs.get(data_dir)
+    if images_dir is None:
+        images_dir = (data_dir / "images").resolve()
+        images_dir.mkdir(parents=True, exist_ok=True)
+        _images_dirs[data_dir] = images_dir
+    return images_dir
+
+def _cleanup_old_images_sync(images_dir: Path):
+    """单次遍历目录，删除超过保留时长的旧图像文件（阻塞操作，需在线程中调用）。"""
+    cutoff = time.time() - IMAGE_RETENTION_SECONDS
     try:
-        if not images_dir.exists():
-            return
-        current_time = datetime.now()
-        cutoff_time = current_time - timedelta(minutes=15)
-        image_patterns = ["blessing_image_*.png", "blessing_image_*.jpg", "blessing_image_*.jpeg"]
-        for pattern in image_patterns:
-            for file_path in images_dir.glob(pattern):
+        with os.scandir(images_dir) as entries:
+            for entry in entries:
+                if not (entry.name.startswith("blessing_image_") and entry.name.endswith(IMAGE_EXTENSIONS)):
+                    continue
                 try:
-                    file_mtime = datetime.fromtimestamp(file_path.stat().st_mtime)
-                    if file_mtime < cutoff_time:
-                        file_path.unlink()
-                        logger.info(f"已清理过期图像: {file_path}")
-                except Exception as e:
-                    logger.warning(f"清理文件 {file_path} 时出错: {e}")
+                    if entry.is_file() and entry.stat().st_mtime < cutoff:
+                        os.unlink(entry.path)
+                        logger.info(f"已清理过期图像: {entry.path}")
+                except OSError as e:
+                    logger.warning(f"清理文件 {entry.path} 时出错: {e}")
+    except FileNotFoundError:
+        return
     except Exception as e:
         logger.error(f"图像清理过程出错: {e}")
 
+async def cleanup_old_images(images_dir: Path):
+    """在线程中清理指定目录下超过15分钟的旧图像文件，两次清理至少间隔 `CLEANUP_INTERVAL_SECONDS` 秒。"""
+    global _last_cleanup
+    now = time.monotonic()
+    if now - _last_cleanup < CLEANUP_INTERVAL_SECONDS:
+        return
+    _last_cleanup = now
+    await asyncio.to_thread(_cleanup_old_images_sync, images_dir)
+
+# 单个请求的默认超时，按请求传入，调用方传入的会话同样受此约束
+_DEFAULT_TIMEOUT = aiohttp.ClientTimeout(total=120)
+
+# 所有API请求都携带的来源标识请求头
+_DEFAULT_HEADERS = {
+    "HTTP-Referer": "https://github.com/astrbot",
+    "X-Title": "AstrBot SendBlessings"
+}
+
+# 模块级共享的HTTP会话，所有图像生成与下载请求复用同一个连接池
+_session: aiohttp.ClientSession | None = None
+_session_lock = asyncio.Lock()
+
+async def _get_session() -> aiohttp.ClientSession:
+    """返回共享的HTTP会话，首次调用或会话已关闭时创建。"""
+    global _session
+    if _session is not None and not _session.closed:
+        return _session
+    async with _session_lock:
+        if _session is None or _session.closed:
+            # 限制连接池大小并缓存DNS；API请求无需携带cookie，使用 DummyCookieJar 避免跨请求复用
+            _session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=50,
+                    limit_per_host=20,
+                    ttl_dns_cache=300,
+                    enable_cleanup_closed=True,
+                    keepalive_timeout=75.0
+                ),
+                cookie_jar=aiohttp.DummyCookieJar(),
+                headers=_DEFAULT_HEADERS
+            )
+        return _session
+
+async def close_session():
+    """关闭共享的HTTP会话，供插件卸载时调用。"""
+    global _session
+    if _session is not None and not _session.closed:
+        await _session.close()
+    _session = None
+
+def _new_image_path(images_dir: Path, image_format: str) -> Path:
+    """生成一个唯一的图像文件保存路径，扩展名限定在清理逻辑可识别的范围内。"""
+    image_format = _IMAGE_FORMATS.get(image_format.lower(), "png")
+    # 纳秒时间戳无需 strftime 格式化；附加计数器以防时钟精度不足时重名
+    return images_dir / f"blessing_image_{time.time_ns():x}_{next(_img_counter):x}.{image_format}"
+
+def _decode_and_write(base64_string: str, image_path: Path):
+    """将base64字符串解码后写入文件（阻塞操作，需在线程中调用）。"""
+    with open(image_path, "wb") as f:
+        f.write(base64.b64decode(base64_string))
+
 async def save_base64_image(base64_string: str, image_format: str, data_dir: Path) -> tuple[str | None, str | None]:
     """将base64编码的图像数据解码并保存到本地。"""
     try:
-        images_dir = data_dir / "images"
-        images_dir.mkdir(exist_ok=True)
-        await cleanup_old_images(images_dir)
-        image_data = base64.b64decode(base64_string)
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        unique_id = str(uuid.uuid4())[:8]
-        image_path = images_dir / f"blessing_image_{timestamp}_{unique_id}.{image_format}"
-        async with aiofiles.open(image_path, "wb") as f:
-            await f.write(image_data)
-        abs_path = str(image_path.absolute())
-        file_url = f"file://{abs_path}"
-        await _state.update_saved_image(file_url, str(image_path))
-        logger.info(f"图像已保存到: {abs_path}")
-        return file_url, str(image_path)
+        images_dir = _get_images_dir(data_dir)
+        image_path = _new_image_path(images_dir, image_format)
+        # 解码与写入均为阻塞操作，合并后一次性放到线程中执行
+        await asyncio.to_thread(_decode_and_write, base64_string, image_path)
+        # images 目录在 _get_images_dir 中已解析为绝对路径，无需再调用 absolute()
+        path_str = str(image_path)
+        file_url = f"file://{path_str}"
+        _state.update_saved_image(file_url, path_str)
+        logger.info(f"图像已保存到: {path_str}")
+        return file_url, path_str
     except (base64.binascii.Error, Exception) as e:
         logger.error(f"保存图像文件失败: {e}")
         return None, None
 
+async def download_image(session: aiohttp.ClientSession, image_url: str, data_dir: Path) -> tuple[str | None, str | None]:
+    """下载API返回的图像URL并保存到本地。"""
+    try:
+        images_dir = _get_images_dir(data_dir)
+        async with session.get(image_url, timeout=_DEFAULT_TIMEOUT) as img_response:
+            img_response.raise_for_status()
+            content_type = img_response.content_type or ""
+            image_format = content_type[len("image/"):] if content_type.startswith("image/") else "png"
+            image_path = _new_image_path(images_dir, image_format)
+            # 按块读取响应体，避免一次性 read() 后再整体复制写入
+            buf = bytearray()
+            async for chunk in img_response.content.iter_chunked(65536):
+                buf.extend(chunk)
+        # 图片通常只有几百KB，缓冲后在线程中一次性写入，避免每块都切换一次线程
+        await asyncio.to_thread(image_path.write_bytes, buf)
+        # images 目录在 _get_images_dir 中已解析为绝对路径，无需再调用 absolute()
+        path_str = str(image_path)
+        file_url = f"file://{path_str}"
+        _state.update_saved_image(file_url, path_str)
+        logger.info(f"图像已下载到: {path_str}")
+        return file_url, path_str
+    except (aiohttp.ClientError, asyncio.TimeoutError, OSError) as e:
+        logger.error(f"下载图像文件失败: {e}")
+        return None, None
+
 def _get_model_config(model_name: str) -> dict:
     """根据模型名称获取其特定配置。"""
     for key, config in MODEL_CONFIGS.items():
@@ -117,10 +229,11 @@ def _build_request_payload(prompt: str, model: str, input_images: list[str], max
     
     message_content = [{"type": "text", "text": prompt}]
     if input_images:
-        for base64_image in input_images:
-            if not base64_image.startswith('data:image/'):
-                base64_image = f"data:image/png;base64,{base64_image}"
-            message_content.append({"type": "image_url", "image_url": {"url": base64_image}})
+        # 未带 data URI 前缀的原始base64统一补全为PNG格式
+        message_content.extend(
+            {"type": "image_url", "image_url": {"url": img if img.startswith('data:image/') else f"data:image/png;base64,{img}"}}
+            for img in input_images
+        )
 
     return model_config["payload_builder"](
         prompt=prompt,
@@ -131,27 +244,35 @@ def _build_request_payload(prompt: str, model: str, input_images: list[str], max
         size="1024x1024"  # For DALL-E like models
     )
 
-async def _send_api_request(session: aiohttp.ClientSession, url: str, headers: dict, payload: dict) -> dict:
-    """发送API请求并返回JSON响应。"""
-    async with session.post(url, json=payload, headers=headers) as response:
+def _dumps(data: dict) -> bytes:
+    """将请求体序列化为JSON字节串，优先使用 orjson。"""
+    return orjson.dumps(data) if orjson else json.dumps(data).encode('utf-8')
+
+async def _send_api_request(session: aiohttp.ClientSession, url: str, headers: dict, body: bytes) -> dict:
+    """发送已序列化的API请求体并返回解析后的JSON响应。"""
+    async with session.post(url, data=body, headers=headers, timeout=_DEFAULT_TIMEOUT) as response:
         response.raise_for_status()  # Will raise an exception for 4xx/5xx status
-        return await response.json()
+        raw = await response.read()
+    # 响应中常包含数MB的base64图像，orjson 解析明显快于标准库
+    return orjson.loads(raw) if orjson else json.loads(raw)
+
+async def _parse_response(session: aiohttp.ClientSession, data: dict, data_dir: Path) -> tuple[str | None, str | None]:
+    """解析API响应以提取图像数据，保存前先清理一次过期图像。"""
+    await cleanup_old_images(_get_images_dir(data_dir))
 
-async def _parse_response(data: dict, data_dir: Path) -> tuple[str | None, str | None]:
-    """解析API响应以提取图像数据。"""
     # 1. DALL-E / nano-banana 格式
     if "data" in data and data["data"]:
         image_item = data["data"][0]
         if "b64_json" in image_item:
             return await save_base64_image(image_item["b64_json"], "png", data_dir)
-        # URL aituprc ...
+        if image_item.get("url"):
+            return await download_image(session, image_item["url"], data_dir)
     
     # 2. Gemini / Chat-based 格式
     elif "choices" in data and data["choices"]:
         content = data["choices"][0].get("message", {}).get("content", "")
         if isinstance(content, str):
-            base64_pattern = r"data:image/([^;]+);base64,([A-Za-z0-9+/=]+)"
-            match = re.search(base64_pattern, content)
+            match = _DATA_URI_RE.search(content)
             if match:
                 return await save_base64_image(match.group(2), match.group(1), data_dir)
     
@@ -167,10 +288,13 @@ async def generate_image_openrouter(
     input_images: list[str] = None,
     api_base: str = None,
     max_retry_attempts: int = 3,
-    temperature: float = 0.7
+    temperature: float = 0.7,
+    session: aiohttp.ClientSession | None = None
 ) -> tuple[str | None, str | None]:
     """
     使用支持OpenAI格式的API生成图像，具有重试和密钥轮换功能。
+
+    未传入 `session` 时使用模块级共享会话，避免每次调用都重新建立TCP/TLS连接。
     """
     if isinstance(api_keys, str):
         api_keys = [api_keys]
@@ -182,28 +306,29 @@ async def generate_image_openrouter(
     base_url = (api_base or "https://openrouter.ai/api").rstrip('/')
     url = f"{base_url}{model_config['endpoint']}"
     
-    payload = _build_request_payload(prompt, model, input_images, max_tokens, temperature)
-
-    for api_attempt in range(len(api_keys)):
-        current_api_key = await _state.get_next_api_key(api_keys)
-        headers = {
-            "Authorization": f"Bearer {current_api_key}",
-            "Content-Type": "application/json",
-            "HTTP-Referer": "https://github.com/astrbot",
-            "X-Title": "AstrBot SendBlessings"
-        }
+    # 请求体在所有密钥和重试之间保持不变，只序列化一次
+    body = _dumps(_build_request_payload(prompt, model, input_images, max_tokens, temperature))
+
+    # 固定的来源标识请求头已设置在共享会话上，调用方传入自己的会话时才需逐次附带
+    headers = {"Authorization": None, "Content-Type": "application/json"}
+    if session is None:
+        session = await _get_session()
+    else:
+        headers.update(_DEFAULT_HEADERS)
+    for _ in range(len(api_keys)):
+        # 请求头只有 Authorization 随密钥变化
+        key_index = _state.api_key_index % len(api_keys)
+        headers["Authorization"] = f"Bearer {api_keys[key_index]}"
 
         for retry_attempt in range(max_retry_attempts):
             try:
-                timeout = aiohttp.ClientTimeout(total=120)
-                async with aiohttp.ClientSession(timeout=timeout) as session:
-                    logger.info(f"尝试生成图像 (密钥: {api_attempt+1}, 重试: {retry_attempt+1})")
-                    response_data = await _send_api_request(session, url, headers, payload)
-                    return await _parse_response(response_data, data_dir)
-            
+                logger.info(f"尝试生成图像 (密钥: #{key_index+1}, 重试: {retry_attempt+1})")
+                response_data = await _send_api_request(session, url, headers, body)
+                return await _parse_response(session, response_data, data_dir)
+
             except aiohttp.ClientResponseError as e:
                 if e.status == 429 or e.status == 402:
-                    logger.warning(f"密钥 #{api_attempt+1} 额度耗尽或速率限制 (HTTP {e.status})。切换到下一个密钥。")
+                    logger.warning(f"密钥 #{key_index+1} 额度耗尽或速率限制 (HTTP {e.status})。切换到下一个密钥。")
                     break  # Stop retrying with this key
                 logger.warning(f"API请求失败 (HTTP {e.status})，重试中... ({retry_attempt+1}/{max_retry_attempts})")
             except (aiohttp.ClientError, asyncio.TimeoutError) as e:
@@ -213,9 +338,11 @@ async def generate_image_openrouter(
                 break # Stop retrying on unknown errors
 
             if retry_attempt < max_retry_attempts - 1:
-                await asyncio.sleep(2 ** retry_attempt) # Exponential backoff
-        
-        await _state.rotate_to_next_api_key(api_keys)
+                # 带随机抖动并设上限的指数退避，避免并发请求同时重试
+                delay = min(RETRY_BASE_DELAY * (2 ** retry_attempt) * (1 + random.uniform(0, RETRY_JITTER)), RETRY_MAX_DELAY)
+                await asyncio.sleep(delay)
+
+        _state.rotate_to_next_api_key(api_keys)
 
     logger.error("所有API密钥和重试次数均已耗尽，图像生成失败。")
     return None, None
@@ -250,4 +377,6 @@ if __name__ == "__main__":
         else:
             logger.error("测试 1 失败。")
 
+        await close_session()
+
     asyncio.run(main())
\ No newline at end of file